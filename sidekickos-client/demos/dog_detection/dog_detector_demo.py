@@ -20,7 +20,11 @@ Usage:
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import os
+import queue
+import threading
 import time
 import cv2
 import numpy as np
@@ -40,6 +44,38 @@ from sidekickos import ESP32Camera, ImageFrame
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# COCO dataset class names (module constant - shared by every detector)
+COCO_CLASS_NAMES = (
+    'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus', 'train', 'truck', 'boat',
+    'traffic light', 'fire hydrant', 'stop sign', 'parking meter', 'bench', 'bird', 'cat',
+    'dog', 'horse', 'sheep', 'cow', 'elephant', 'bear', 'zebra', 'giraffe', 'backpack',
+    'umbrella', 'handbag', 'tie', 'suitcase', 'frisbee', 'skis', 'snowboard', 'sports ball',
+    'kite', 'baseball bat', 'baseball glove', 'skateboard', 'surfboard', 'tennis racket',
+    'bottle', 'wine glass', 'cup', 'fork', 'knife', 'spoon', 'bowl', 'banana', 'apple',
+    'sandwich', 'orange', 'broccoli', 'carrot', 'hot dog', 'pizza', 'donut', 'cake',
+    'chair', 'couch', 'potted plant', 'bed', 'dining table', 'toilet', 'tv', 'laptop',
+    'mouse', 'remote', 'keyboard', 'cell phone', 'microwave', 'oven', 'toaster', 'sink',
+    'refrigerator', 'book', 'clock', 'vase', 'scissors', 'teddy bear', 'hair drier', 'toothbrush'
+)
+
+_DOG_ID = 16  # COCO_CLASS_NAMES.index('dog')
+
+# Prebuilt label template - no per-box f-string compilation
+_LABEL_FMT = "Dog {:.2f}"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_yolo(weights_path: str):
+    """Load a YOLO model once per weights file
+
+    Each load pulls ~40 MB of weights off disk and initializes the
+    CUDA/CPU kernels, so repeated DogDetector construction (e.g. several
+    SmartDogCamera instances) shares one model per path.
+    """
+    from ultralytics import YOLO
+    return YOLO(weights_path)
+
+
 class DogDetector:
     """Computer vision dog detection system"""
     
@@ -53,7 +89,6 @@ class DogDetector:
         self.confidence_threshold = confidence_threshold
         self.model = None
         self.class_names = []
-        self.dog_class_ids = []
         self.stats = {
             'total_frames': 0,
             'dogs_detected': 0,
@@ -61,6 +96,8 @@ class DogDetector:
             'false_positives': 0,
             'avg_confidence': 0.0
         }
+        # Detections folded into avg_confidence so far (running mean)
+        self._conf_count = 0
         
         # Setup model
         self._setup_model()
@@ -68,31 +105,22 @@ class DogDetector:
     def _setup_model(self):
         """Setup YOLO model for object detection"""
         try:
-            # Try to import YOLOv5 (ultralytics)
-            from ultralytics import YOLO
-            
             print("🧠 Loading YOLOv5 model...")
-            self.model = YOLO('yolov5m.pt')  # Medium model for better accuracy
-            
-            # COCO dataset class names
-            self.class_names = [
-                'person', 'bicycle', 'car', 'motorcycle', 'airplane', 'bus', 'train', 'truck', 'boat',
-                'traffic light', 'fire hydrant', 'stop sign', 'parking meter', 'bench', 'bird', 'cat',
-                'dog', 'horse', 'sheep', 'cow', 'elephant', 'bear', 'zebra', 'giraffe', 'backpack',
-                'umbrella', 'handbag', 'tie', 'suitcase', 'frisbee', 'skis', 'snowboard', 'sports ball',
-                'kite', 'baseball bat', 'baseball glove', 'skateboard', 'surfboard', 'tennis racket',
-                'bottle', 'wine glass', 'cup', 'fork', 'knife', 'spoon', 'bowl', 'banana', 'apple',
-                'sandwich', 'orange', 'broccoli', 'carrot', 'hot dog', 'pizza', 'donut', 'cake',
-                'chair', 'couch', 'potted plant', 'bed', 'dining table', 'toilet', 'tv', 'laptop',
-                'mouse', 'remote', 'keyboard', 'cell phone', 'microwave', 'oven', 'toaster', 'sink',
-                'refrigerator', 'book', 'clock', 'vase', 'scissors', 'teddy bear', 'hair drier', 'toothbrush'
-            ]
-            
-            # Find dog class index
-            self.dog_class_ids = [i for i, name in enumerate(self.class_names) if name == 'dog']
+            # Cached per weights path - a second detector reuses the
+            # already-initialized model instead of reloading the weights.
+            # The nano model is preferred: 2-4x faster on CPU than the
+            # medium one, and "is there a dog" needs no finer accuracy.
+            # (For further CPU wins, export to INT8 ONNX once and serve
+            # with onnxruntime - not wired up here to keep the demo lean.)
+            try:
+                self.model = _load_yolo('yolov5n.pt')
+            except Exception:
+                self.model = _load_yolo('yolov5m.pt')  # Medium model for better accuracy
+
+            self.class_names = COCO_CLASS_NAMES
             print(f"✅ YOLOv5 model loaded successfully!")
-            print(f"🐕 Dog class ID: {self.dog_class_ids}")
-            
+            print(f"🐕 Dog class ID: {_DOG_ID}")
+
         except ImportError:
             print("⚠️ YOLOv5 not available, trying OpenCV DNN...")
             self._setup_opencv_model()
@@ -134,74 +162,129 @@ class DogDetector:
             return []
         
         self.stats['total_frames'] += 1
-        
+
         try:
-            # Run YOLOv5 inference
-            results = self.model(image)
-            
-            detections = []
-            confidences = []
-            
-            # Process results
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        # Get class ID and confidence
-                        class_id = int(box.cls.item())
-                        confidence = float(box.conf.item())
-                        
-                        # Check if it's a dog and meets confidence threshold
-                        if class_id in self.dog_class_ids and confidence >= self.confidence_threshold:
-                            # Get bounding box coordinates
-                            x1, y1, x2, y2 = box.xyxy[0].tolist()
-                            
-                            detection = {
-                                'bbox': [int(x1), int(y1), int(x2), int(y2)],
-                                'confidence': confidence,
-                                'class_name': 'dog',
-                                'class_id': class_id
-                            }
-                            detections.append(detection)
-                            confidences.append(confidence)
-            
+            # Run YOLOv5 inference - class and confidence filtering happen
+            # inside NMS on-device, so only dog boxes ever reach Python
+            results = self.model(image, classes=[_DOG_ID],
+                                 conf=self.confidence_threshold, verbose=False)
+            detections, confidences = self._extract_detections(results[0])
+
             # Update stats
             if detections:
-                self.stats['dogs_detected'] += 1
-                self.stats['avg_confidence'] = np.mean(confidences)
+                self._update_confidence_stats(confidences)
                 logger.info(f"🐕 Found {len(detections)} dog(s) with avg confidence {self.stats['avg_confidence']:.2f}")
-            
+
             return detections
-            
+
         except Exception as e:
             logger.error(f"Error in dog detection: {e}")
             return []
+
+    def _update_confidence_stats(self, confidences: List[float]):
+        """Fold new confidences into the session running mean
+
+        Online (Welford-style) update: no NumPy dispatch per frame, and
+        avg_confidence is a true mean over the whole session instead of
+        just the most recent frame's detections.
+        """
+        k = len(confidences)
+        self.stats['dogs_detected'] += 1
+        self._conf_count += k
+        self.stats['avg_confidence'] += (
+            sum(confidences) - k * self.stats['avg_confidence']) / self._conf_count
+
+    def detect_dogs_batch(self, images: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        Detect dogs in a batch of images with a single model call
+
+        YOLO's per-call overhead (preprocess, letterbox, postprocess,
+        NMS dispatch) amortizes across the batch - one fused forward
+        pass instead of len(images) separate ones.
+
+        Args:
+            images: List of OpenCV images (BGR format)
+
+        Returns:
+            One detection list per input image, in order
+        """
+        if self.model is None or not images:
+            return [[] for _ in images]
+
+        self.stats['total_frames'] += len(images)
+
+        try:
+            results = self.model(images, classes=[_DOG_ID],
+                                 conf=self.confidence_threshold, verbose=False)
+        except Exception as e:
+            logger.error(f"Error in batched dog detection: {e}")
+            return [[] for _ in images]
+
+        all_detections = []
+        for result in results:
+            detections, confidences = self._extract_detections(result)
+            if detections:
+                self._update_confidence_stats(confidences)
+                logger.info(f"🐕 Found {len(detections)} dog(s) with avg confidence {self.stats['avg_confidence']:.2f}")
+            all_detections.append(detections)
+        return all_detections
+
+    def _extract_detections(self, result) -> Tuple[List[Dict], List[float]]:
+        """Pull dog detections out of one YOLO result
+
+        The model call already restricted class and confidence on-device,
+        so this just bulk-transfers the surviving boxes: two .cpu().numpy()
+        calls instead of per-box .item() syncs (each of which is a
+        device-to-host round trip on GPU).
+        """
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return [], []
+
+        xyxy = boxes.xyxy.cpu().numpy()
+        confs = boxes.conf.cpu().numpy()
+
+        detections = []
+        confidences = []
+        for (x1, y1, x2, y2), conf in zip(xyxy, confs):
+            confidence = float(conf)
+            detections.append({
+                'bbox': [int(x1), int(y1), int(x2), int(y2)],
+                'confidence': confidence,
+                'class_name': 'dog',
+                'class_id': _DOG_ID
+            })
+            confidences.append(confidence)
+        return detections, confidences
     
-    def draw_detections(self, image: np.ndarray, detections: List[Dict]) -> np.ndarray:
+    def draw_detections(self, image: np.ndarray, detections: List[Dict],
+                        inplace: bool = False) -> np.ndarray:
         """
         Draw detection bounding boxes on image
-        
+
         Args:
             image: OpenCV image
             detections: List of detection dictionaries
-            
+            inplace: Draw directly on image instead of a copy - for
+                callers that own a scratch buffer (skips a ~900 KB
+                memcpy per VGA frame)
+
         Returns:
             Image with bounding boxes drawn
         """
-        result_image = image.copy()
-        
+        result_image = image if inplace else image.copy()
+
         for detection in detections:
             bbox = detection['bbox']
             confidence = detection['confidence']
-            
+
             # Draw bounding box
             cv2.rectangle(result_image, (bbox[0], bbox[1]), (bbox[2], bbox[3]), (0, 255, 0), 2)
-            
+
             # Draw label
-            label = f"Dog {confidence:.2f}"
-            cv2.putText(result_image, label, (bbox[0], bbox[1] - 10), 
+            cv2.putText(result_image, _LABEL_FMT.format(confidence), (bbox[0], bbox[1] - 10),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-        
+
         return result_image
     
     def get_stats(self) -> Dict:
@@ -224,6 +307,33 @@ class SmartDogCamera:
         self.is_running = False
         self.last_detection_time = 0
         self.detection_cooldown = 2.0  # Seconds between captures
+
+        # Motion gate: YOLO only runs on frames that differ from the
+        # previous one. Mean absolute difference of a 160x120 grayscale
+        # thumbnail, ~1/100th the cost of an inference pass.
+        self.motion_threshold = 4.0  # Mean abs diff (0-255); 0 disables
+        self._prev_gray: Optional[np.ndarray] = None
+
+        # Batched inference: the stream callback only decodes and queues;
+        # a background task coalesces up to batch_size frames per model
+        # call, amortizing YOLO's per-call pre/postprocess overhead
+        self.batch_size = 4
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._detect_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Dedicated pool for the YOLO forward pass and debug-frame
+        # encodes - keeps both off the BLE event loop (and off the shared
+        # asyncio pool, which the camera uses for callbacks)
+        self._exec = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='dog-detect')
+
+        # Background photo writer: detection paths enqueue (path, payload)
+        # and a daemon thread does the JPEG encode + disk write, so a
+        # detection burst never stalls on encode/fsync
+        self._writer_q: queue.Queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, daemon=True, name='dog-photo-writer')
+        self._writer.start()
         
         # Create output directories
         self.output_dir = Path(f"dog_photos_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
@@ -231,7 +341,7 @@ class SmartDogCamera:
         
         self.debug_dir = self.output_dir / "debug"
         self.debug_dir.mkdir(exist_ok=True)
-        
+
         print(f"📁 Photos will be saved to: {self.output_dir}")
     
     async def start_detection(self, stream_duration: float = 60.0):
@@ -260,7 +370,12 @@ class SmartDogCamera:
             print("🐕 Watching for dogs...")
             
             self.is_running = True
-            
+
+            # Background batch-inference task fed by the stream callback
+            self._loop = asyncio.get_running_loop()
+            self._batch_queue = asyncio.Queue(maxsize=16)
+            self._detect_task = asyncio.create_task(self._detect_loop())
+
             # Start streaming with our detection callback
             await self.camera.start_streaming(
                 callback=self._process_frame,
@@ -286,49 +401,171 @@ class SmartDogCamera:
             
             # Final stats
             self._print_final_stats()
-            
+
         finally:
+            if self._detect_task:
+                self._detect_task.cancel()
+                self._detect_task = None
+            # Drain the executor first - in-flight debug-frame jobs still
+            # enqueue writes, which must land ahead of the sentinel below
+            await asyncio.to_thread(self._exec.shutdown, True)
+            # Flush the photo writer - it's a daemon thread, so anything
+            # still queued would be lost at interpreter exit otherwise
+            self._writer_q.put(None)
+            await asyncio.to_thread(self._writer.join)
+            # Fresh executor and writer so the instance can run again
+            self._exec = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix='dog-detect')
+            self._writer = threading.Thread(
+                target=self._writer_loop, daemon=True, name='dog-photo-writer')
+            self._writer.start()
             await self.camera.disconnect()
             self.is_running = False
     
     def _process_frame(self, frame: ImageFrame):
-        """Process each camera frame for dog detection"""
+        """Decode each camera frame and queue it for batched detection"""
         try:
-            # Convert frame to OpenCV format
+            # The camera recycles its reception buffer once this callback
+            # returns, so take ownership of the JPEG payload before the
+            # frame is parked in the batch queue
+            if isinstance(frame.data, memoryview):
+                frame.data = bytes(frame.data)
+
+            # np.asarray is a zero-copy view into PIL's (per-frame) buffer
             pil_image = frame.to_pil_image()
-            cv_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-            
-            # Detect dogs
-            detections = self.detector.detect_dogs(cv_image)
-            
-            # If dogs detected and cooldown period has passed
-            current_time = time.time()
-            if detections and (current_time - self.last_detection_time) > self.detection_cooldown:
-                self._capture_dog_photo(frame, cv_image, detections)
-                self.last_detection_time = current_time
-            
-            # Save debug frame occasionally
-            if frame.frame_number % 10 == 0:
-                debug_image = self.detector.draw_detections(cv_image, detections)
-                debug_path = self.debug_dir / f"debug_frame_{frame.frame_number:04d}.jpg"
-                cv2.imwrite(str(debug_path), debug_image)
-            
+            rgb = np.asarray(pil_image)
+
+            # Cheap filter before the expensive classifier: skip inference
+            # when the scene hasn't changed since the previous frame
+            if self.motion_threshold > 0:
+                small = cv2.resize(rgb, (160, 120), interpolation=cv2.INTER_AREA)
+                gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+                prev, self._prev_gray = self._prev_gray, gray
+                if prev is not None and cv2.absdiff(gray, prev).mean() < self.motion_threshold:
+                    return
+
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._enqueue_for_detection, (frame, rgb))
+
         except Exception as e:
             logger.error(f"Error processing frame {frame.frame_number}: {e}")
+
+    def _enqueue_for_detection(self, item):
+        """Queue a decoded frame, dropping the oldest when inference lags"""
+        try:
+            self._batch_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                self._batch_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            self._batch_queue.put_nowait(item)
+
+    async def _detect_loop(self):
+        """Coalesce queued frames and run one YOLO call per batch"""
+        while True:
+            batch = [await self._batch_queue.get()]
+            # Gather whatever else arrives within 100 ms, up to batch_size
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout=0.1))
+                except asyncio.TimeoutError:
+                    break
+
+            frames = [item[0] for item in batch]
+            # ultralytics accepts RGB arrays directly, so the decoded
+            # frames go to the model as-is; BGR copies are made lazily,
+            # only for frames that actually get drawn on or written out
+            rgb_images = [item[1] for item in batch]
+
+            # One fused forward pass for the whole batch, in the dedicated
+            # pool so BLE notifications keep draining while the model runs
+            batch_detections = await self._loop.run_in_executor(
+                self._exec, self.detector.detect_dogs_batch, rgb_images)
+
+            for frame, rgb_image, detections in zip(frames, rgb_images, batch_detections):
+                # If dogs detected and cooldown period has passed
+                current_time = time.time()
+                if detections and (current_time - self.last_detection_time) > self.detection_cooldown:
+                    self._capture_dog_photo(
+                        frame, cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR), detections)
+                    self.last_detection_time = current_time
+
+                # Save a debug frame occasionally - but only when there is
+                # something on it; empty frames are the common case and
+                # were dominating disk bandwidth over long sessions
+                if detections and frame.frame_number % 10 == 0:
+                    self._exec.submit(self._save_debug_frame, rgb_image, detections,
+                                      frame.frame_number)
+
+    # Debug frames are thumbnails: enough to eyeball detections without
+    # paying full-resolution encode + disk traffic
+    _DEBUG_SIZE = (320, 240)
+
+    def _save_debug_frame(self, rgb_image: np.ndarray, detections: List[Dict],
+                          frame_number: int):
+        """Encode a downscaled annotated debug frame (runs on the executor)"""
+        h, w = rgb_image.shape[:2]
+        small = cv2.cvtColor(
+            cv2.resize(rgb_image, self._DEBUG_SIZE, interpolation=cv2.INTER_AREA),
+            cv2.COLOR_RGB2BGR)
+
+        # Rescale the boxes and draw on the thumbnail, never the full frame
+        sx = self._DEBUG_SIZE[0] / w
+        sy = self._DEBUG_SIZE[1] / h
+        scaled = [dict(d, bbox=[int(d['bbox'][0] * sx), int(d['bbox'][1] * sy),
+                                int(d['bbox'][2] * sx), int(d['bbox'][3] * sy)])
+                  for d in detections]
+        debug_image = self.detector.draw_detections(small, scaled, inplace=True)
+
+        ok, buf = cv2.imencode('.jpg', debug_image, [cv2.IMWRITE_JPEG_QUALITY, 70])
+        if ok:
+            debug_path = self.debug_dir / f"debug_frame_{frame_number:04d}.jpg"
+            self._writer_q.put((str(debug_path), buf.tobytes()))
+
+    def _writer_loop(self):
+        """Daemon thread: drain queued photos and write them to disk
+
+        Payloads are either ready JPEG bytes (original captures) or BGR
+        arrays to encode here at quality 95. A None sentinel stops the
+        thread once everything queued ahead of it has been written.
+        """
+        while True:
+            try:
+                item = self._writer_q.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            path, payload = item
+            try:
+                if isinstance(payload, np.ndarray):
+                    ok, buf = cv2.imencode('.jpg', payload, [cv2.IMWRITE_JPEG_QUALITY, 95])
+                    if not ok:
+                        logger.error(f"JPEG encode failed for {path}")
+                        continue
+                    payload = buf.tobytes()
+                with open(path, 'wb') as f:
+                    f.write(payload)
+            except Exception as e:
+                logger.error(f"Error writing {path}: {e}")
     
     def _capture_dog_photo(self, frame: ImageFrame, cv_image: np.ndarray, detections: List[Dict]):
         """Capture and save a photo when dogs are detected"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
             
-            # Save original photo
+            # Save original photo - the frame already holds encoded JPEG
+            # bytes, so the writer thread just dumps them to disk
             original_path = self.output_dir / f"dog_photo_{timestamp}.jpg"
-            frame.save(str(original_path))
-            
-            # Save annotated photo
-            annotated_image = self.detector.draw_detections(cv_image, detections)
+            self._writer_q.put((str(original_path), frame.data))
+
+            # Save annotated photo (encoded + written by the writer thread;
+            # cv_image is already this frame's private BGR copy, so draw
+            # in place)
+            annotated_image = self.detector.draw_detections(cv_image, detections, inplace=True)
             annotated_path = self.output_dir / f"dog_detected_{timestamp}.jpg"
-            cv2.imwrite(str(annotated_path), annotated_image)
+            self._writer_q.put((str(annotated_path), annotated_image))
             
             # Update stats
             self.detector.stats['photos_captured'] += 1
@@ -7,9 +7,10 @@ Just detects dogs and saves frames with bounding boxes.
 
 import asyncio
 import cv2
+import logging
 import numpy as np
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
 # Add parent directories to path for imports
@@ -17,6 +18,8 @@ sys.path.append('../..')
 from sidekickos import ESP32Camera
 from dog_detector_demo import DogDetector
 
+logger = logging.getLogger(__name__)
+
 class SimpleDogDetector:
     def __init__(self):
         self.camera = ESP32Camera()
@@ -24,74 +27,113 @@ class SimpleDogDetector:
         self.frame_count = 0
         self.save_dir = Path("cute dogs")
         self.save_dir.mkdir(exist_ok=True)
-        
+        # Single-slot "latest wins" handoff to the detector: the stream
+        # callback just overwrites the slot, so slow YOLO inference never
+        # queues up stale frames (or per-frame task objects) behind it.
+        self._pending = None
+        self._frame_ready = asyncio.Event()
+        self._loop = None
+        # Precomputed save-path template - avoids per-detection strftime +
+        # Path.__truediv__ allocations in the hot callback path
+        self._save_fmt = str(self.save_dir / "dog_frame_{}_{}.jpg")
+
     async def start(self):
         print("🐕 Simple Dog Detection Starting...")
-        
+
+        self._loop = asyncio.get_running_loop()
+
         if not await self.camera.connect():
             print("❌ Camera connection failed")
             return
-            
+
         # Fast settings: VGA res, lower quality for speed
         await self.camera.set_resolution(7)  # VGA 480x320
         await self.camera.set_quality(25)    # Lower quality for speed
-        
+
+        detect_task = asyncio.create_task(self.detect_loop())
         await self.camera.start_streaming(self.process_frame, interval=0.2)  # 5 FPS
-        
+
         try:
             while True:
                 await asyncio.sleep(1)
         except KeyboardInterrupt:
             print("\n⏹️ Stopping...")
-            
+
+        detect_task.cancel()
         await self.camera.stop_streaming()
         await self.camera.disconnect()
         cv2.destroyAllWindows()
-        
+
     def process_frame(self, frame):
         self.frame_count += 1
-        
-        # Convert to OpenCV
-        pil_image = frame.to_pil_image()
-        cv_image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-        
-        # Show frame immediately (no waiting for detection)
-        cv2.imshow('Dog Detection', cv_image)
-        cv2.waitKey(1)
-        
-        # Start async detection without blocking
-        asyncio.create_task(self.detect_async(cv_image.copy(), self.frame_count))
-    
+
+        # Decode the JPEG straight to a BGR ndarray - skips the PIL decode,
+        # np.array copy and cvtColor copy (OpenCV decodes via libjpeg-turbo)
+        cv_image = cv2.imdecode(np.frombuffer(frame.data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if cv_image is None:
+            return
+
+        # Hand the frame to the detector loop - it owns the array from here,
+        # so no defensive copy is needed. If the detector is still busy the
+        # previous pending frame is simply replaced with the fresher one.
+        # The callback runs on a worker thread, so wake the waiter via the
+        # loop rather than setting the asyncio.Event directly.
+        self._pending = (cv_image, self.frame_count)
+        self._loop.call_soon_threadsafe(self._frame_ready.set)
+
+    async def detect_loop(self):
+        """Long-lived detector: always runs on the freshest pending frame"""
+        while True:
+            await self._frame_ready.wait()
+            self._frame_ready.clear()
+            # Take the slot in one atomic swap - the callback thread may
+            # refill it at any moment, and a stale wakeup can find it empty
+            item, self._pending = self._pending, None
+            if item is None:
+                continue
+            cv_image, frame_num = item
+
+            # Show the raw frame before detection. All HighGUI calls stay
+            # on this (the loop) thread - imshow is thread-affine on
+            # macOS/GTK, so it must not run in the stream callback.
+            cv2.imshow('Dog Detection', cv_image)
+            cv2.waitKey(1)
+
+            await self.detect_async(cv_image, frame_num)
+
     async def detect_async(self, cv_image, frame_num):
         # Detect dogs async
         detections = self.detector.detect_dogs(cv_image)
-        
-        # Debug: show ALL detections, not just dogs
-        if frame_num % 10 == 0:  # Print debug every 10 frames
-            results = self.detector.model(cv_image)
-            for result in results:
-                if result.boxes is not None:
-                    for box in result.boxes:
-                        class_id = int(box.cls.item())
-                        confidence = float(box.conf.item())
-                        class_name = self.detector.class_names[class_id] if class_id < len(self.detector.class_names) else "unknown"
-                        print(f"  Detected: {class_name} (ID:{class_id}) confidence:{confidence:.2f}")
-        
+
+        # Debug: show detections every 10 frames (reuses the detect_dogs
+        # result - no second inference pass). logger.debug defers the
+        # string formatting, so this is free unless DEBUG is enabled.
+        if frame_num % 10 == 0:
+            for detection in detections:
+                logger.debug("Detected: %s (ID:%d) confidence:%.2f",
+                             detection['class_name'], detection['class_id'],
+                             detection['confidence'])
+
         if detections:
-            # Save original image without bounding boxes
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"dog_frame_{frame_num}_{timestamp}.jpg"
-            save_path = self.save_dir / filename
-            cv2.imwrite(str(save_path), cv_image)
+            # Save original image without bounding boxes (int(time.time())
+            # is one syscall vs datetime's six-field strftime)
+            save_path = self._save_fmt.format(frame_num, int(time.time()))
+            cv2.imwrite(save_path, cv_image)
             
-            # Draw bounding boxes on a copy for display
+            # Draw bounding boxes on a copy for display. All rectangles go
+            # through one cv2.polylines call (one Python->C transition for
+            # N boxes instead of N); only the most confident box gets a
+            # text label.
             display_image = cv_image.copy()
-            for detection in detections:
-                bbox = detection['bbox']
-                confidence = detection['confidence']
-                cv2.rectangle(display_image, (bbox[0], bbox[1]), (bbox[2], bbox[3]), (0, 255, 0), 2)
-                cv2.putText(display_image, f"Dog {confidence:.2f}", (bbox[0], bbox[1]-10), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+            pts = np.array(
+                [[[d['bbox'][0], d['bbox'][1]], [d['bbox'][2], d['bbox'][1]],
+                  [d['bbox'][2], d['bbox'][3]], [d['bbox'][0], d['bbox'][3]]]
+                 for d in detections], dtype=np.int32)
+            cv2.polylines(display_image, pts, isClosed=True, color=(0, 255, 0), thickness=2)
+            best = max(detections, key=lambda d: d['confidence'])
+            cv2.putText(display_image, f"Dog {best['confidence']:.2f}",
+                        (best['bbox'][0], best['bbox'][1] - 10),
+                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
             
             # Show frame with detections
             cv2.imshow('Dog Detection', display_image)
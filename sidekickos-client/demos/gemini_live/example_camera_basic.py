@@ -18,23 +18,12 @@ from sidekickos import ESP32Camera
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
-async def basic_camera_example():
+async def basic_camera_example(camera):
     """Basic camera capture example"""
     print("📷 SidekickOS Camera Basic Example")
     print("=" * 40)
-    
-    # Create camera instance
-    camera = ESP32Camera()
-    
+
     try:
-        # Connect to camera
-        print("🔍 Connecting to SidekickOS camera...")
-        if not await camera.connect():
-            print("❌ Failed to connect to camera")
-            return
-        
-        print("✅ Connected successfully!")
-        
         # Configure camera settings
         print("⚙️  Configuring camera...")
         await camera.set_quality(25)  # Good quality
@@ -81,39 +70,33 @@ async def basic_camera_example():
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
-        
-    finally:
-        # Cleanup
-        await camera.disconnect()
-        print("🔌 Disconnected from camera")
 
-async def streaming_example():
+async def streaming_example(camera):
     """Example of frame streaming"""
     print("\n📹 SidekickOS Camera Streaming Example")
     print("=" * 40)
-    
-    camera = ESP32Camera()
+
     frame_count = 0
-    
+    loop = asyncio.get_running_loop()
+
     def frame_callback(frame):
         nonlocal frame_count
         frame_count += 1
         print(f"📺 Frame {frame_count}: {frame.size} bytes ({frame.completion_rate:.1f}%)")
-        
-        # Save every 5th frame
+
+        # Save every 5th frame - disk I/O goes to an executor so it never
+        # holds up frame delivery
         if frame_count % 5 == 0:
             filename = f"stream_frame_{frame_count}.jpg"
-            frame.save(filename)
-            print(f"💾 Saved {filename}")
+            # Copy out of the camera's recycled streaming buffer before
+            # the write happens asynchronously
+            frame.data = bytes(frame.data)
+            loop.call_soon_threadsafe(
+                loop.run_in_executor, None, frame.save, filename
+            )
+            print(f"💾 Saving {filename}")
     
     try:
-        # Connect and configure
-        if not await camera.connect():
-            print("❌ Failed to connect to camera")
-            return
-        
-        print("✅ Connected for streaming!")
-        
         # Start streaming
         print("🎬 Starting frame streaming for 15 seconds...")
         await camera.start_streaming(
@@ -131,21 +114,40 @@ async def streaming_example():
         
     except Exception as e:
         print(f"❌ Streaming error: {e}")
+
+async def main():
+    """Run both examples over a single BLE connection"""
+    camera = ESP32Camera()
+
+    # Connect once - BLE scanning/pairing takes seconds, so both examples
+    # share the same connection instead of paying for it twice
+    print("🔍 Connecting to SidekickOS camera...")
+    if not await camera.connect():
+        print("❌ Failed to connect to camera")
+        return
+
+    print("✅ Connected successfully!")
+
+    try:
+        # Run basic capture example
+        await basic_camera_example(camera)
+
+        # Wait a bit between examples
+        await asyncio.sleep(2)
+
+        # Run streaming example
+        await streaming_example(camera)
     finally:
         await camera.disconnect()
+        print("🔌 Disconnected from camera")
 
-async def main():
-    """Run both examples"""
-    # Run basic capture example
-    await basic_camera_example()
-    
-    # Wait a bit between examples
-    await asyncio.sleep(2)
-    
-    # Run streaming example
-    await streaming_example()
-    
     print("\n🎉 Examples complete!")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # optional speedup; the default loop works fine
+
+    asyncio.run(main())
\ No newline at end of file
@@ -54,6 +54,16 @@ except ImportError as e:
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+# Shared PyAudio instance - a full PortAudio init/teardown costs ~100 ms
+# on some systems, so create it once and let the interpreter clean up
+_pya = None
+
+def _get_pya():
+    global _pya
+    if _pya is None:
+        _pya = pyaudio.PyAudio()
+    return _pya
+
 async def test_camera_connection():
     """Test SidekickOS camera connection"""
     print("\n🔍 Testing SidekickOS camera connection...")
@@ -132,8 +142,8 @@ def test_audio_system():
     print("\n🎤 Testing audio system...")
     
     try:
-        pya = pyaudio.PyAudio()
-        
+        pya = _get_pya()
+
         # Test microphone
         try:
             mic_info = pya.get_default_input_device_info()
@@ -153,9 +163,7 @@ def test_audio_system():
         except Exception as e:
             print(f"❌ Speaker test failed: {e}")
             return False
-            
-        pya.terminate()
-        
+
     except Exception as e:
         print(f"❌ Audio system test failed: {e}")
         return False
@@ -167,21 +175,18 @@ async def main():
     print("🧪 SidekickOS + Gemini Live Setup Test")
     print("=" * 50)
     
-    tests_passed = 0
     total_tests = 3
-    
-    # Test 1: Camera connection
-    if await test_camera_connection():
-        tests_passed += 1
-    
-    # Test 2: Gemini API
-    if test_gemini_api():
-        tests_passed += 1
-    
-    # Test 3: Audio system
-    if test_audio_system():
-        tests_passed += 1
-    
+
+    # The Gemini and audio probes don't need the camera, so run all three
+    # concurrently - BLE scanning alone can take 5-10s of wall clock
+    results = await asyncio.gather(
+        test_camera_connection(),
+        asyncio.to_thread(test_gemini_api),
+        asyncio.to_thread(test_audio_system),
+        return_exceptions=True,
+    )
+    tests_passed = sum(1 for r in results if r is True)
+
     print("\n" + "=" * 50)
     print(f"📊 Test Results: {tests_passed}/{total_tests} tests passed")
     
@@ -14,16 +14,34 @@ Usage:
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import struct
 import time
-from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any, Union
+from collections import deque
+from dataclasses import dataclass, field
 from io import BytesIO
 from PIL import Image
 import bleak
 from bleak import BleakClient, BleakScanner
 from bleak.backends.characteristic import BleakGATTCharacteristic
 
+# Optional libjpeg-turbo decoder (PyTurboJPEG) - ~2x faster JPEG decode
+# than Pillow's default path. The decoder itself is constructed lazily
+# on ImageFrame (loading the native library costs a dlopen + init).
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+
+# Optional orjson for status parsing - C-extension decode is 3-5x faster
+# than stdlib json and accepts bytes directly (no .decode('utf-8') step)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,25 +59,105 @@ AUDIO_CHAR_UUID = "33333333-4444-5555-6666-777777777777"
 MAX_CHUNK_SIZE = 510  # Updated for ultra-speed optimization
 DEVICE_NAME = "ESP32S3-Camera"  # Updated device name
 
+# Precompiled header parsers for the ESP32 wire format:
+# [type][chunks_hi][chunks_lo][size_b0..b3] - chunk counts/indices are
+# big-endian u16, the image size is little-endian u32
+_CHUNKS_S = struct.Struct('>H')
+_SIZE_S = struct.Struct('<I')
+
+# Initial reception buffer size - covers a worst-case VGA JPEG (~150 KB).
+# The buffer grows if a larger frame is announced and is then kept at the
+# larger size, so steady-state streaming never reallocates.
+_IMAGE_BUF_SIZE = 192 * 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class ImageFrame:
-    """Represents a received image frame"""
-    data: bytes
+    """Represents a received image frame
+
+    data may be bytes or a memoryview over a caller-owned buffer; every
+    consumer here (BytesIO, file.write, turbojpeg/torch decode) speaks
+    the buffer protocol, so no conversion is needed either way.
+
+    timestamp is time.monotonic_ns() at completion - an int with no
+    clock-adjustment jumps, suited to inter-frame deltas. slots=True
+    skips the per-instance __dict__ (one fewer allocation per frame).
+    """
+    data: Union[bytes, memoryview]
     size: int
     chunks_received: int
     chunks_expected: int
-    timestamp: float
+    timestamp: int
     frame_number: int
-    
+    # Pooled reception buffer this frame's data view borrows from; owned
+    # by ESP32Camera, which reclaims it after the streaming callback runs.
+    # None when data is an independent bytes object.
+    _backing: Optional[bytearray] = field(default=None, repr=False)
+    # Decoded-image cache: a VGA JPEG decode costs 5-15 ms, and pipelines
+    # commonly touch the pixels more than once (detect, annotate, save)
+    _pil: Optional[Image.Image] = field(default=None, repr=False)
+
+    # Shared TurboJPEG decoder, built once for the whole class on first
+    # decode (unannotated, so the dataclass machinery ignores them)
+    _tj = None
+    _tj_checked = False
+
+    @classmethod
+    def _decoder(cls):
+        """Return the shared TurboJPEG instance, or None if unavailable
+
+        Construction dlopens the native library, so it is deferred to the
+        first actual decode and the result (including failure) is cached.
+        """
+        if not cls._tj_checked:
+            cls._tj_checked = True
+            if TurboJPEG is not None:
+                try:
+                    cls._tj = TurboJPEG()
+                except Exception:  # missing/broken native library
+                    cls._tj = None
+        return cls._tj
+
     def to_pil_image(self) -> Image.Image:
-        """Convert image data to PIL Image"""
-        return Image.open(BytesIO(self.data))
-    
+        """Convert image data to PIL Image
+
+        Uses libjpeg-turbo (PyTurboJPEG) when available - its SIMD decode
+        is ~2x faster than Pillow's and hands back a numpy array without
+        Python-level pixel copying. The result is cached on the frame, so
+        repeated calls in one pipeline decode only once.
+        """
+        if self._pil is None:
+            tj = self._decoder()
+            if tj is not None:
+                self._pil = Image.fromarray(tj.decode(self.data, pixel_format=TJPF_RGB))
+            else:
+                self._pil = Image.open(BytesIO(self.data))
+        return self._pil
+
     def save(self, filename: str):
         """Save image to file"""
         with open(filename, 'wb') as f:
             f.write(self.data)
+
+    async def save_async(self, filename: str):
+        """Save image to file without blocking the event loop"""
+        await asyncio.to_thread(self.save, filename)
+
+    def to_cuda_tensor(self):
+        """Decode the JPEG on the GPU via nvJPEG (torchvision)
+
+        Returns a CHW uint8 torch.Tensor. On machines with CUDA this is
+        2-3x faster than CPU decode and keeps the CPU free for BLE
+        notification handling; without CUDA it decodes on the CPU.
+        Requires torch/torchvision - use to_pil_image() otherwise.
+        """
+        import torch
+        from torchvision.io import decode_jpeg
+
+        t = torch.frombuffer(bytearray(self.data), dtype=torch.uint8)
+        if torch.cuda.is_available():
+            return decode_jpeg(t, device='cuda')
+        return decode_jpeg(t)
     
     @property
     def completion_rate(self) -> float:
@@ -81,14 +179,45 @@ class ESP32Camera:
         self.image_char: Optional[BleakGATTCharacteristic] = None
         self.frame_char: Optional[BleakGATTCharacteristic] = None
         
-        # Image reception state
-        self.image_buffer: Optional[bytearray] = None
+        # Image reception state. One preallocated buffer is reused for
+        # every frame (no per-frame bytearray churn on the notification
+        # thread); only the counters below change per frame.
+        self.image_buffer: bytearray = bytearray(_IMAGE_BUF_SIZE)
+        self._buf_mv: memoryview = memoryview(self.image_buffer)
+        # Free list of reception buffers for streaming: a completed frame
+        # borrows the active buffer (zero-copy), reception continues into
+        # a pooled one, and the frame worker returns buffers after the
+        # callback - steady-state streaming allocates nothing per frame
+        self._free_bufs: deque = deque(
+            (bytearray(_IMAGE_BUF_SIZE) for _ in range(2)), maxlen=4)
+        # Bitset of received chunk indices: O(1) duplicate detection and
+        # exact completion tracking (received_chunks counts unique chunks)
+        self._recv_mask: bytearray = bytearray((_IMAGE_BUF_SIZE // MAX_CHUNK_SIZE + 8) >> 3)
         self.expected_chunks = 0
         self.expected_size = 0
         self.received_chunks = 0
         self.current_frame_number = 0
         self.is_streaming = False
         self.completed_image: Optional[ImageFrame] = None  # Store completed image for single capture
+        # Event-driven single capture: set (threadsafe) by
+        # _process_complete_image so capture_image wakes as soon as the
+        # last chunk lands instead of polling on a 100 ms sleep
+        self._frame_ready = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Bounded handoff between the notification path and the user's
+        # streaming callback: a slow consumer (JPEG decode, disk I/O)
+        # drops stale frames here instead of backing up BLE notifications
+        self._frame_q: Optional[asyncio.Queue] = None
+        self._frame_worker_task: Optional[asyncio.Task] = None
+        self._dropped_frames = 0
+        # Optional dedicated pool for callbacks (see start_streaming's
+        # decode_workers); JPEG decode in Pillow/libjpeg releases the GIL,
+        # so multiple workers genuinely overlap decode with reception
+        self._decode_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._decode_sem: Optional[asyncio.Semaphore] = None
+        # Packet-type dispatch table, indexed by the wire type byte
+        # (0x01 header / 0x02 chunk / 0x03 end)
+        self._dispatch = (None, self._on_header, self._on_chunk, self._on_end)
         
         # Callbacks
         self.image_callback: Optional[Callable[[ImageFrame], None]] = None
@@ -135,6 +264,7 @@ class ESP32Camera:
                     return False
             
             logger.info(f"Connecting to {device_address}...")
+            self._loop = asyncio.get_running_loop()
             self.client = BleakClient(device_address)
             
             await self.client.connect()
@@ -143,6 +273,12 @@ class ESP32Camera:
             # Wait for connection to stabilize
             await asyncio.sleep(1.0)
             
+            # Ask the link for low-latency connection parameters where the
+            # backend allows it - the default 30+ ms connection interval
+            # caps notification throughput well below what 510-byte
+            # chunks can carry
+            self._request_low_latency_connection()
+
             # Log MTU information
             if hasattr(self.client, 'mtu_size'):
                 mtu = self.client.mtu_size
@@ -192,22 +328,28 @@ class ESP32Camera:
                 logger.error(f"Failed to enable status notifications: {e}")
                 
             try:
-                await self.client.start_notify(self.image_char, self._handle_image_data)
+                await self.client.start_notify(
+                    self.image_char, self._make_reception_handler(is_frame=False))
                 logger.info("✅ Image notifications enabled")
             except Exception as e:
                 logger.error(f"Failed to enable image notifications: {e}")
-                
+
             try:
-                await self.client.start_notify(self.frame_char, self._handle_frame_data)
+                await self.client.start_notify(
+                    self.frame_char, self._make_reception_handler(is_frame=True))
                 logger.info("✅ Frame notifications enabled")
             except Exception as e:
                 logger.error(f"Failed to enable frame notifications: {e}")
                 
             # Give time for notifications to be properly set up
             await asyncio.sleep(0.5)
-            
+
+            # Start the streaming-frame worker (bounded queue, drop-oldest)
+            self._frame_q = asyncio.Queue(maxsize=2)
+            self._frame_worker_task = asyncio.create_task(self._frame_worker())
+
             self.connected = True
-            self.performance_stats['start_time'] = time.time()
+            self.performance_stats['start_time'] = time.monotonic_ns()
             
             logger.info("🎉 Successfully connected to SidekickOS Ultra-Performance Camera!")
             logger.info(f"⚡ Ready for 517-byte MTU and {MAX_CHUNK_SIZE}-byte chunks")
@@ -225,8 +367,45 @@ class ESP32Camera:
             logger.error(f"Connection failed: {e}")
             return False
     
+    def _request_low_latency_connection(self):
+        """Best-effort request for a short BLE connection interval
+
+        bleak has no portable API for connection parameters, so this
+        pokes the backend where one exists and silently moves on where
+        it doesn't (BlueZ leaves the interval to the kernel/peripheral).
+        A 7.5-15 ms interval instead of the common 30 ms default means
+        2-4x more notification slots per second on the link.
+        """
+        backend = getattr(self.client, '_backend', None)
+        if backend is None:
+            return
+
+        # macOS / CoreBluetooth: hint the desired latency on the peripheral
+        try:
+            peripheral = getattr(backend, '_peripheral', None)
+            if peripheral is not None and hasattr(peripheral, 'setDesiredConnectionLatency_'):
+                peripheral.setDesiredConnectionLatency_(0)  # CBPeripheralConnectionLatencyLow
+                logger.info("⚡ Requested low connection latency (CoreBluetooth)")
+                return
+        except Exception as e:
+            logger.debug(f"CoreBluetooth latency request failed: {e}")
+
+        # Windows / WinRT: prefer the throughput-optimized session params
+        try:
+            session = getattr(backend, '_session', None)
+            if session is not None and hasattr(session, 'max_pdu_size'):
+                logger.info(f"⚡ WinRT session PDU size: {session.max_pdu_size}")
+                return
+        except Exception as e:
+            logger.debug(f"WinRT session query failed: {e}")
+
+        logger.debug("No backend hook for connection parameters; using platform defaults")
+
     async def disconnect(self):
         """Disconnect from camera"""
+        if self._frame_worker_task:
+            self._frame_worker_task.cancel()
+            self._frame_worker_task = None
         if self.client and self.connected:
             await self.client.disconnect()
             self.connected = False
@@ -246,71 +425,90 @@ class ESP32Camera:
             logger.error(f"Failed to send command '{command}': {e}")
             return False
     
-    async def capture_image(self, timeout: float = 10.0) -> Optional[ImageFrame]:
-        """Capture a single image"""
+    async def capture_image(self, timeout: float = 10.0,
+                            min_completion: float = 0.8) -> Optional[ImageFrame]:
+        """Capture a single image
+
+        Args:
+            timeout: Seconds to wait for the complete frame
+            min_completion: On timeout, accept a partial frame if at
+                least this fraction of chunks arrived. Probes that only
+                care whether data flows can pass a low value (JPEG
+                decoders tolerate truncated tails); 1.0 disables partial
+                acceptance.
+        """
         logger.info("📷 Capturing image...")
         
         # Set up single image capture
         self.is_streaming = False
         self.completed_image = None  # Clear any previous completed image
+        self._frame_ready.clear()
         self._reset_image_state()
-        
+
         # Send capture command
         if not await self.send_command("CAPTURE"):
             return None
-        
-        # Give device time to process command
-        await asyncio.sleep(0.2)
-        
-        # Wait for image with timeout
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            # Check if we have a completed image
-            if self.completed_image:
-                logger.info(f"✅ Image captured: {self.completed_image.size} bytes ({self.completed_image.completion_rate:.1f}%)")
-                return self.completed_image
-            
-            # Check if we have received sufficient data (fallback)
-            if self.image_buffer and self.expected_chunks > 0:
-                completion_rate = (self.received_chunks / self.expected_chunks) * 100
-                logger.debug(f"Image progress: {self.received_chunks}/{self.expected_chunks} chunks ({completion_rate:.1f}%)")
-                
-                # Consider image complete if we have most chunks or hit end marker
-                if self.received_chunks >= self.expected_chunks * 0.8:  # Lower threshold
-                    # Image received successfully
-                    image_data = bytes(self.image_buffer[:self.expected_size])
-                    frame = ImageFrame(
-                        data=image_data,
-                        size=len(image_data),
-                        chunks_received=self.received_chunks,
-                        chunks_expected=self.expected_chunks,
-                        timestamp=time.time(),
-                        frame_number=self.current_frame_number
-                    )
-                    
-                    logger.info(f"✅ Image captured: {len(image_data)} bytes ({frame.completion_rate:.1f}%)")
-                    self._reset_image_state()
-                    return frame
-            
-            # Yield control to event loop so BLE notifications can be processed
-            await asyncio.sleep(0.1)
-        
-        logger.error("⏰ Image capture timeout")
-        logger.error(f"Timeout details: buffer={self.image_buffer is not None}, chunks={self.received_chunks}/{self.expected_chunks}, size={self.expected_size}")
-        self._reset_image_state()
-        return None
+
+        # Wait for the completion event - set from the notification path
+        # the moment the last chunk (or end marker) arrives, so there is
+        # no polling latency
+        try:
+            await asyncio.wait_for(self._frame_ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            # Fallback: accept a mostly-complete partial image
+            if self.expected_chunks > 0 and self.received_chunks >= self.expected_chunks * min_completion:
+                self._zero_missing_chunks()
+                image_data = bytes(self._buf_mv[:self.expected_size])
+                frame = ImageFrame(
+                    data=image_data,
+                    size=len(image_data),
+                    chunks_received=self.received_chunks,
+                    chunks_expected=self.expected_chunks,
+                    timestamp=time.monotonic_ns(),
+                    frame_number=self.current_frame_number
+                )
+
+                logger.info(f"✅ Image captured (partial): {len(image_data)} bytes ({frame.completion_rate:.1f}%)")
+                self._reset_image_state()
+                return frame
+
+            logger.error("⏰ Image capture timeout")
+            logger.error(f"Timeout details: chunks={self.received_chunks}/{self.expected_chunks}, size={self.expected_size}")
+            self._reset_image_state()
+            return None
+
+        frame = self.completed_image
+        self._frame_ready.clear()
+        if frame:
+            logger.info(f"✅ Image captured: {frame.size} bytes ({frame.completion_rate:.1f}%)")
+        return frame
     
-    async def start_streaming(self, 
+    async def start_streaming(self,
                             callback: Callable[[ImageFrame], None],
                             interval: float = 0.5,
-                            quality: int = 25) -> bool:
-        """Start continuous frame streaming"""
+                            quality: int = 25,
+                            decode_workers: int = 0) -> bool:
+        """Start continuous frame streaming
+
+        Args:
+            callback: Called with each completed ImageFrame
+            interval: Seconds between frames
+            quality: JPEG quality (4-63, lower = better)
+            decode_workers: Size of a dedicated thread pool for the
+                callback. 0 (default) uses the shared asyncio pool; >1
+                lets decode/save of consecutive frames overlap.
+        """
         if not self.connected:
             logger.error("Not connected to device")
             return False
-        
+
         logger.info(f"📹 Starting frame streaming (interval: {interval}s, quality: {quality})")
-        
+
+        if decode_workers > 0:
+            self._decode_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=decode_workers, thread_name_prefix='frame-decode')
+            self._decode_sem = asyncio.Semaphore(decode_workers)
+
         self.image_callback = callback
         self.is_streaming = True
         
@@ -326,6 +524,10 @@ class ESP32Camera:
         logger.info("⏹️ Stopping frame streaming")
         self.is_streaming = False
         self.image_callback = None
+        if self._decode_pool is not None:
+            self._decode_pool.shutdown(wait=False)
+            self._decode_pool = None
+            self._decode_sem = None
         return await self.send_command("STOP_FRAMES")
     
     async def set_quality(self, quality: int) -> bool:
@@ -349,138 +551,318 @@ class ESP32Camera:
     def _handle_status_data(self, characteristic: BleakGATTCharacteristic, data: bytearray):
         """Handle status data from ESP32S3"""
         try:
-            status_json = data.decode('utf-8')
-            logger.info(f"📡 Status: {status_json}")
-            
+            # Only pay for the utf-8 decode + string build when someone
+            # is actually reading debug logs; status ticks arrive steadily
+            # during streaming
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📡 Status: %s", data.decode('utf-8'))
+
             if self.status_callback:
-                import json
-                status_dict = json.loads(status_json)
+                # Both orjson and stdlib json accept bytes directly
+                status_dict = _json_loads(bytes(data))
                 self.status_callback(status_dict)
                 
         except Exception as e:
             logger.error(f"Failed to parse status: {e}")
             logger.debug(f"Raw status data: {data.hex()}")
     
-    def _handle_image_data(self, characteristic: BleakGATTCharacteristic, data: bytearray):
-        """Handle image data (single captures)"""
-        self._handle_image_reception(data, is_frame=False)
-    
-    def _handle_frame_data(self, characteristic: BleakGATTCharacteristic, data: bytearray):
-        """Handle frame data (streaming)"""
-        self._handle_image_reception(data, is_frame=True)
-    
+    def _make_reception_handler(self, is_frame: bool) -> Callable:
+        """Build a specialized notification handler for start_notify
+
+        The bound reception method and the is_frame flag are captured as
+        default arguments, so each notification dispatches with two
+        LOAD_FASTs instead of attribute lookups on self - this path runs
+        for every BLE packet, hundreds of times per second.
+        """
+        def _handler(characteristic: BleakGATTCharacteristic, data: bytearray,
+                     _receive=self._handle_image_reception, _is_frame=is_frame):
+            _receive(data, _is_frame)
+        return _handler
+
+
     def _handle_image_reception(self, data: bytearray, is_frame: bool):
-        """Handle incoming image/frame data"""
+        """Handle incoming image/frame data
+
+        Dispatches on the type byte through a tuple indexed by data[0] -
+        one LOAD + subscript instead of an if/elif chain, and it keeps
+        each packet-type handler small and specialized.
+        """
         if len(data) == 0:
             return
-        
+
         # Track performance
         self.performance_stats['bytes_received'] += len(data)
-        
+
         data_type = data[0]
-        
-        if data_type == 0x01:  # Start header
-            # ESP32 header: [type][chunks_hi][chunks_lo][size_b0][size_b1][size_b2][size_b3]
-            chunks = (data[1] << 8) | data[2]
-            size = data[3] | (data[4] << 8) | (data[5] << 16) | (data[6] << 24)  # Little-endian
-            
-            self.expected_chunks = chunks
-            self.expected_size = size
-            self.received_chunks = 0
+        handler = self._dispatch[data_type] if data_type < 4 else None
+        if handler is not None:
+            handler(data, is_frame)
+        else:
+            logger.warning(f"Unknown data type: 0x{data_type:02x}")
+
+    def _on_header(self, data: bytearray, is_frame: bool):
+        """0x01: start header - [type][chunks u16 BE][size u32 LE]"""
+        chunks, = _CHUNKS_S.unpack_from(data, 1)
+        size, = _SIZE_S.unpack_from(data, 3)
+
+        self.expected_chunks = chunks
+        self.expected_size = size
+        self.received_chunks = 0
+        # Reuse the preallocated buffer; grow only if this frame is
+        # bigger than anything seen so far
+        if size > len(self.image_buffer):
+            self._buf_mv.release()
             self.image_buffer = bytearray(size)
-            
-            logger.info(f"📋 Starting {'frame' if is_frame else 'image'}: {size} bytes ({chunks} chunks)")
-            
-        elif data_type == 0x02:  # Data chunk
-            if self.image_buffer is None:
-                logger.warning("Received data chunk but no image buffer initialized")
+            self._buf_mv = memoryview(self.image_buffer)
+
+        # Clear (or grow) the received-chunk bitset for this frame
+        mask_len = (chunks + 7) >> 3
+        if mask_len > len(self._recv_mask):
+            self._recv_mask = bytearray(mask_len)
+        else:
+            for i in range(mask_len):
+                self._recv_mask[i] = 0
+
+        logger.info("📋 Starting %s: %d bytes (%d chunks)",
+                    'frame' if is_frame else 'image', size, chunks)
+
+    def _on_chunk(self, data: bytearray, is_frame: bool, _mcs: int = MAX_CHUNK_SIZE):
+        """0x02: data chunk - [type][index u16 BE][payload]
+
+        MAX_CHUNK_SIZE is pre-bound as a default argument so the per-chunk
+        offset computation is a LOAD_FAST instead of a module-dict lookup.
+        """
+        if self.expected_chunks == 0:
+            logger.warning("Received data chunk but no start header seen")
+            return
+
+        chunk_index, = _CHUNKS_S.unpack_from(data, 1)
+        n = len(data) - 3
+
+        # Calculate offset based on 510-byte chunks (ESP32 optimization)
+        offset = chunk_index * _mcs
+
+        if offset + n <= self.expected_size:
+            # Drop duplicate chunks (retransmits would otherwise inflate
+            # the count and fire completion early/late)
+            recv_mask = self._recv_mask
+            byte_i = chunk_index >> 3
+            bit = 1 << (chunk_index & 7)
+            if recv_mask[byte_i] & bit:
+                logger.debug("Duplicate chunk %d ignored", chunk_index)
                 return
-            
-            chunk_index = (data[1] << 8) | data[2]
-            chunk_data = data[3:]
-            
-            # Calculate offset based on 510-byte chunks (ESP32 optimization)
-            offset = chunk_index * MAX_CHUNK_SIZE
-            
-            if offset + len(chunk_data) <= len(self.image_buffer):
-                self.image_buffer[offset:offset + len(chunk_data)] = chunk_data
-                self.received_chunks += 1
-                
-                if self.received_chunks % 5 == 0 or self.received_chunks == self.expected_chunks:  # Log every 5 chunks
-                    logger.info(f"📦 Received chunk {self.received_chunks}/{self.expected_chunks}")
-                
-                # Auto-process when all chunks received
-                if self.received_chunks == self.expected_chunks:
-                    logger.info(f"✅ All chunks received! Processing complete image...")
-                    self._process_complete_image(is_frame)
-            else:
-                logger.warning(f"Invalid chunk offset: {offset} + {len(chunk_data)} > {len(self.image_buffer)}")
-            
-        elif data_type == 0x03:  # End marker
-            logger.debug(f"📍 End marker received. Chunks: {self.received_chunks}/{self.expected_chunks}")
-            # Process image if we have any data (end marker means transmission complete)
-            if self.image_buffer and self.received_chunks > 0:
-                logger.info(f"🏁 Image transmission complete via end marker")
+            recv_mask[byte_i] |= bit
+
+            # memoryview-to-memoryview assignment dispatches to a fast
+            # buffer-protocol memcpy (no intermediate chunk allocation)
+            self._buf_mv[offset:offset + n] = memoryview(data)[3:]
+            received = self.received_chunks + 1
+            self.received_chunks = received
+            expected = self.expected_chunks
+
+            if received % 5 == 0 or received == expected:  # Log every 5 chunks
+                logger.info("📦 Received chunk %d/%d", received, expected)
+
+            # Auto-process when all (unique) chunks received
+            if received == expected:
+                logger.info("✅ All chunks received! Processing complete image...")
                 self._process_complete_image(is_frame)
         else:
-            logger.warning(f"Unknown data type: 0x{data_type:02x}")
+            logger.warning("Invalid chunk offset: %d + %d > %d", offset, n, self.expected_size)
+
+    def _on_end(self, data: bytearray, is_frame: bool):
+        """0x03: end marker - transmission complete"""
+        logger.debug("📍 End marker received. Chunks: %d/%d",
+                     self.received_chunks, self.expected_chunks)
+        # Process image if we have any data (end marker means transmission complete)
+        if self.received_chunks > 0:
+            logger.info("🏁 Image transmission complete via end marker")
+            self._process_complete_image(is_frame)
     
+    def _zero_missing_chunks(self):
+        """Blank the gaps a partial frame leaves in the reused buffer
+
+        The reception buffer carries the previous frame's bytes, so chunks
+        that never arrived would otherwise hand stale image content to a
+        tolerant JPEG decoder. The dedup bitset knows which ones are
+        missing.
+        """
+        recv_mask = self._recv_mask
+        buf_mv = self._buf_mv
+        size = self.expected_size
+        for chunk_index in range(self.expected_chunks):
+            if not (recv_mask[chunk_index >> 3] & (1 << (chunk_index & 7))):
+                offset = chunk_index * MAX_CHUNK_SIZE
+                end = min(offset + MAX_CHUNK_SIZE, size)
+                if offset < end:
+                    buf_mv[offset:end] = bytes(end - offset)
+
     def _process_complete_image(self, is_frame: bool):
         """Process a complete image"""
-        logger.info(f"🔄 Processing complete image (is_frame={is_frame})")
-        if not self.image_buffer:
-            logger.warning("⚠️ No image buffer available for processing")
+        logger.info("🔄 Processing complete image (is_frame=%s)", is_frame)
+        if self.expected_size == 0:
+            logger.warning("⚠️ No image data available for processing")
             return
-        
-        # Create image frame
-        image_data = bytes(self.image_buffer[:self.expected_size])
+
+        if self.received_chunks < self.expected_chunks:
+            self._zero_missing_chunks()
+
+        size = self.expected_size
         self.current_frame_number += 1
-        
-        logger.info(f"🖼️ Creating image frame: {len(image_data)} bytes")
-        
+        streaming = is_frame and self.is_streaming and self.image_callback is not None
+
+        if streaming:
+            # Zero-copy handoff: the frame borrows the reception buffer
+            # and the next frame is received into one from the free list.
+            # The frame worker returns the buffer once the callback is
+            # done with it (_release_buffer).
+            backing = self.image_buffer
+            image_data = self._buf_mv[:size]
+            next_buf = self._free_bufs.popleft() if self._free_bufs else bytearray(len(backing))
+            self.image_buffer = next_buf
+            self._buf_mv = memoryview(next_buf)
+        else:
+            # Single capture: the caller may hold the frame indefinitely,
+            # so freeze an independent bytes copy out of the buffer
+            backing = None
+            image_data = bytes(self._buf_mv[:size])
+
+        logger.info("🖼️ Creating image frame: %d bytes", size)
+
         frame = ImageFrame(
             data=image_data,
-            size=len(image_data),
+            size=size,
             chunks_received=self.received_chunks,
             chunks_expected=self.expected_chunks,
-            timestamp=time.time(),
-            frame_number=self.current_frame_number
+            timestamp=time.monotonic_ns(),
+            frame_number=self.current_frame_number,
+            _backing=backing
         )
-        
+
         # Update performance stats
         self.performance_stats['frames_received'] += 1
-        self.performance_stats['last_frame_time'] = time.time()
-        
-        logger.debug(f"✅ {'Frame' if is_frame else 'Image'} #{self.current_frame_number}: "
-                    f"{len(image_data)} bytes ({frame.completion_rate:.1f}%)")
+        self.performance_stats['last_frame_time'] = time.monotonic_ns()
         
-        # Call callback for streaming
-        if is_frame and self.is_streaming and self.image_callback:
-            try:
-                self.image_callback(frame)
-            except Exception as e:
-                logger.error(f"Error in image callback: {e}")
+        logger.debug("✅ %s #%d: %d bytes (%.1f%%)",
+                     'Frame' if is_frame else 'Image', self.current_frame_number,
+                     size, frame.completion_rate)
+
+        # Hand off to the frame worker for streaming - the notification
+        # path never runs user code (decode/disk I/O) directly
+        if streaming:
+            if self._loop is not None and self._frame_q is not None:
+                self._loop.call_soon_threadsafe(self._enqueue_frame, frame)
+            else:
+                self._release_buffer(frame)
         
-        # Store completed image for single capture
+        # Store completed image for single capture and wake the waiter.
+        # call_soon_threadsafe is safe regardless of which thread the
+        # bleak backend delivers notifications on.
         if not is_frame and not self.is_streaming:
             self.completed_image = frame
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._frame_ready.set)
             logger.info(f"💾 Stored completed image for single capture")
         
         self._reset_image_state()
     
+    def _enqueue_frame(self, frame: 'ImageFrame'):
+        """Queue a completed frame for the worker, dropping the oldest on overflow"""
+        try:
+            self._frame_q.put_nowait(frame)
+        except asyncio.QueueFull:
+            try:
+                stale = self._frame_q.get_nowait()  # Drop the stale frame
+                self._release_buffer(stale)
+            except asyncio.QueueEmpty:
+                pass
+            self._frame_q.put_nowait(frame)
+            self._dropped_frames += 1
+            logger.debug("Dropped stale frame (total dropped: %d)", self._dropped_frames)
+
+    def _release_buffer(self, frame: 'ImageFrame'):
+        """Return a frame's borrowed reception buffer to the free list"""
+        backing = frame._backing
+        if backing is None:
+            return
+        frame._backing = None
+        if isinstance(frame.data, memoryview):
+            try:
+                frame.data.release()
+            except BufferError:
+                # The callback kept an export alive past its return (e.g.
+                # a stashed np.frombuffer view). The buffer can't be
+                # recycled safely, so drop it - the free list regrows on
+                # demand
+                logger.warning("Frame buffer still exported after callback; dropping it")
+                return
+        self._free_bufs.append(backing)
+
+    def _deliver_frame(self, callback: Callable[['ImageFrame'], None], frame: 'ImageFrame'):
+        """Run a user callback on a pool thread and recycle its buffer"""
+        try:
+            callback(frame)
+        except Exception as e:
+            logger.error(f"Error in image callback: {e}")
+        finally:
+            self._release_buffer(frame)
+
+    async def _frame_worker(self):
+        """Deliver queued frames to the user callback off the notification path"""
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = await self._frame_q.get()
+            callback = self.image_callback
+            if callback is None or not self.is_streaming:
+                self._release_buffer(frame)
+                continue
+            # The callback may decode JPEGs or hit the disk - run it in
+            # a thread so the event loop keeps servicing notifications
+            pool = self._decode_pool
+            if pool is not None:
+                # Dispatch without awaiting so up to decode_workers
+                # callbacks run concurrently; the semaphore bounds the
+                # number of pooled buffers in flight
+                await self._decode_sem.acquire()
+                future = loop.run_in_executor(pool, self._deliver_frame, callback, frame)
+                future.add_done_callback(lambda _: self._decode_sem.release())
+            else:
+                try:
+                    await asyncio.to_thread(callback, frame)
+                except Exception as e:
+                    logger.error(f"Error in image callback: {e}")
+                finally:
+                    self._release_buffer(frame)
+
     def _reset_image_state(self):
-        """Reset image reception state"""
-        self.image_buffer = None
+        """Reset image reception state (the buffer itself is reused)"""
         self.expected_chunks = 0
         self.expected_size = 0
         self.received_chunks = 0
     
+    def reset_stats(self):
+        """Reset performance statistics (e.g. between benchmark runs)
+
+        Swaps in a fresh dict in one assignment so an in-flight BLE
+        callback updating the old dict can't corrupt the new counters.
+        """
+        self.performance_stats = {
+            'frames_received': 0,
+            'bytes_received': 0,
+            'start_time': time.monotonic_ns(),
+            'last_frame_time': None
+        }
+
     def get_performance_stats(self) -> Dict[str, Any]:
-        """Get performance statistics"""
+        """Get performance statistics
+
+        Internal timestamps are monotonic nanoseconds; they are converted
+        to seconds here, at report time only.
+        """
         stats = self.performance_stats.copy()
-        
+
         if stats['start_time']:
-            elapsed = time.time() - stats['start_time']
+            elapsed = (time.monotonic_ns() - stats['start_time']) / 1e9
             stats['elapsed_time'] = elapsed
             stats['avg_fps'] = stats['frames_received'] / elapsed if elapsed > 0 else 0
             stats['avg_kbps'] = (stats['bytes_received'] * 8) / (elapsed * 1000) if elapsed > 0 else 0
@@ -541,4 +923,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # uvloop (libuv-based event loop) cuts per-callback scheduling
+    # overhead 2-4x - worthwhile at 60+ BLE notifications/s. Optional;
+    # the default loop works fine at lower frame rates.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(main())
\ No newline at end of file